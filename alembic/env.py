@@ -13,6 +13,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from app.Models.Influencer import Influencer
 from app.Models.Client import Client
+from app.Models.CampaignStat import CampaignStat
+from app.Models.User import User
+from app.Models.Batch import Batch
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,63 @@
+"""Create clients and influencers
+
+Revision ID: 0d4f1c2b7a35
+Revises: 
+Create Date: 2025-03-31 18:20:11.907342
+
+Base schema that used to be created by Base.metadata.create_all at boot.
+Databases created that way are already stamped at e39fb876edc6 or later,
+so Alembic never runs this revision on them; on an empty database it lets
+`alembic upgrade head` build the full schema.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0d4f1c2b7a35'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'clients',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=True),
+        sa.Column('company_name', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_clients_id'), 'clients', ['id'], unique=False)
+    op.create_index(op.f('ix_clients_name'), 'clients', ['name'], unique=False)
+    op.create_index(op.f('ix_clients_company_name'), 'clients', ['company_name'], unique=False)
+
+    # Columns as they were before e39fb876edc6 added the outcome fields
+    op.create_table(
+        'influencers',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(), nullable=True),
+        sa.Column('client_id', sa.Integer(), nullable=True),
+        sa.Column('sent_via', sa.String(), nullable=True),
+        sa.Column('message_status', sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(['client_id'], ['clients.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_influencers_id'), 'influencers', ['id'], unique=False)
+    op.create_index(op.f('ix_influencers_username'), 'influencers', ['username'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_influencers_username'), table_name='influencers')
+    op.drop_index(op.f('ix_influencers_id'), table_name='influencers')
+    op.drop_table('influencers')
+    op.drop_index(op.f('ix_clients_company_name'), table_name='clients')
+    op.drop_index(op.f('ix_clients_name'), table_name='clients')
+    op.drop_index(op.f('ix_clients_id'), table_name='clients')
+    op.drop_table('clients')
@@ -0,0 +1,42 @@
+"""Add influencer search indexes
+
+Revision ID: 7c2a91d4b3f0
+Revises: e39fb876edc6
+Create Date: 2026-10-18 10:12:31.482903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2a91d4b3f0'
+down_revision: Union[str, None] = 'e39fb876edc6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_influencers_username_trgm',
+        'influencers',
+        ['username'],
+        postgresql_using='gin',
+        postgresql_ops={'username': 'gin_trgm_ops'},
+    )
+    op.execute(
+        "CREATE INDEX ix_influencers_username_lower_prefix "
+        "ON influencers (lower(username) text_pattern_ops)"
+    )
+    op.create_index('ix_influencers_client_id_id', 'influencers', ['client_id', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_influencers_client_id_id', table_name='influencers')
+    op.drop_index('ix_influencers_username_lower_prefix', table_name='influencers')
+    op.drop_index('ix_influencers_username_trgm', table_name='influencers')
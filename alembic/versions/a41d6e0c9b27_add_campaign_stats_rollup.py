@@ -0,0 +1,64 @@
+"""Add campaign_stats rollup
+
+Revision ID: a41d6e0c9b27
+Revises: 7c2a91d4b3f0
+Create Date: 2026-10-18 11:03:47.219551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41d6e0c9b27'
+down_revision: Union[str, None] = '7c2a91d4b3f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('influencers', sa.Column('processed_at', sa.DateTime(), nullable=True))
+    # Existing outcomes: best available timestamp for when they were written
+    op.execute(
+        "UPDATE influencers "
+        "SET processed_at = COALESCE(message_sent_at, updated_at, created_at) "
+        "WHERE message_status IS TRUE OR error_code IS NOT NULL"
+    )
+
+    op.create_table(
+        'campaign_stats',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('client_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('sent_via', sa.String(), server_default='', nullable=False),
+        sa.Column('message_status', sa.Boolean(), nullable=False),
+        sa.Column('error_code', sa.String(), server_default='', nullable=False),
+        sa.Column('count', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['client_id'], ['clients.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'client_id', 'day', 'sent_via', 'message_status', 'error_code',
+            name='uq_campaign_stats_bucket',
+        ),
+    )
+    op.create_index(op.f('ix_campaign_stats_id'), 'campaign_stats', ['id'], unique=False)
+
+    # Seed the rollup from the outcomes already in the table
+    op.execute(
+        "INSERT INTO campaign_stats (client_id, day, sent_via, message_status, error_code, count) "
+        "SELECT client_id, CAST(processed_at AS DATE), COALESCE(sent_via, ''), "
+        "COALESCE(message_status, FALSE), COALESCE(error_code, ''), COUNT(*) "
+        "FROM influencers "
+        "WHERE processed_at IS NOT NULL AND client_id IS NOT NULL "
+        "GROUP BY 1, 2, 3, 4, 5"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_campaign_stats_id'), table_name='campaign_stats')
+    op.drop_table('campaign_stats')
+    op.drop_column('influencers', 'processed_at')
@@ -1,7 +1,7 @@
 """Added error_code and error_reason
 
 Revision ID: e39fb876edc6
-Revises: 
+Revises: 0d4f1c2b7a35
 Create Date: 2025-04-01 02:01:48.551304
 
 """
@@ -13,7 +13,7 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision: str = 'e39fb876edc6'
-down_revision: Union[str, None] = None
+down_revision: Union[str, None] = '0d4f1c2b7a35'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
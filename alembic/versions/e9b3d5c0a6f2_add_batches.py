@@ -0,0 +1,58 @@
+"""Add batches
+
+Revision ID: e9b3d5c0a6f2
+Revises: c58e2f7a1d94
+Create Date: 2026-10-18 15:41:19.336270
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9b3d5c0a6f2'
+down_revision: Union[str, None] = 'c58e2f7a1d94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'batches',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('client_id', sa.Integer(), nullable=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(), server_default='pending', nullable=False),
+        sa.Column('total_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('processed_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('sent_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('failed_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(), nullable=True),
+        sa.Column('updated_at', sa.TIMESTAMP(), nullable=True),
+        sa.Column('started_at', sa.TIMESTAMP(), nullable=True),
+        sa.Column('completed_at', sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(['client_id'], ['clients.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_batches_id'), 'batches', ['id'], unique=False)
+    op.create_index(op.f('ix_batches_client_id'), 'batches', ['client_id'], unique=False)
+
+    op.add_column('influencers', sa.Column('batch_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_influencers_batch_id'), 'influencers', ['batch_id'], unique=False)
+    op.create_foreign_key(
+        'influencers_batch_id_fkey', 'influencers', 'batches', ['batch_id'], ['id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('influencers_batch_id_fkey', 'influencers', type_='foreignkey')
+    op.drop_index(op.f('ix_influencers_batch_id'), table_name='influencers')
+    op.drop_column('influencers', 'batch_id')
+    op.drop_index(op.f('ix_batches_client_id'), table_name='batches')
+    op.drop_index(op.f('ix_batches_id'), table_name='batches')
+    op.drop_table('batches')
@@ -0,0 +1,80 @@
+"""Measure cold import and startup time of the API app.
+
+Usage:
+    python -m app.Console.Commands.BenchmarkStartup [--runs N] [--top N]
+
+Each run starts a fresh interpreter that imports main and runs the app
+lifespan startup, so nothing is shared between runs. Also reports the
+slowest imports (from -X importtime) and whether the automation stack
+(Playwright) got loaded, which API-only workers should never do.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+async def boot():
+    async with main.app.router.lifespan_context(main.app):
+        pass
+
+asyncio.run(boot())
+booted = time.perf_counter()
+print(json.dumps({
+    "import": imported - started,
+    "startup": booted - imported,
+    "playwright_loaded": any(name.startswith("playwright") for name in sys.modules),
+}))
+"""
+
+def run_probe(env):
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def slowest_imports(env, top):
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        env=env, capture_output=True, text=True, check=True,
+    ).stderr
+    imports = []
+    for line in stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nesting is shown as two spaces per level; keep main's own imports
+        # and what they pull in directly.
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if 1 <= depth <= 2:
+            imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:top]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API cold start")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="How many slow imports to list")
+    args = parser.parse_args()
+
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    results = [run_probe(env) for _ in range(args.runs)]
+
+    for phase in ("import", "startup"):
+        times = [r[phase] * 1000 for r in results]
+        print(f"{phase:>8}: median {statistics.median(times):.1f} ms, min {min(times):.1f} ms, max {max(times):.1f} ms")
+    print(f"Playwright loaded: {any(r['playwright_loaded'] for r in results)}")
+
+    print("Slowest imports (cumulative):")
+    for cumulative, name in slowest_imports(env, args.top):
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+if __name__ == "__main__":
+    main()
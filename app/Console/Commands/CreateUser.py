@@ -0,0 +1,46 @@
+"""Create a user account.
+
+Usage:
+    python -m app.Console.Commands.CreateUser EMAIL --full-name NAME [--superuser]
+
+The password is prompted for. Registration over the API requires a
+superuser, so the first one has to be created here.
+"""
+import argparse
+import asyncio
+import getpass
+from fastapi_users.exceptions import UserAlreadyExists
+from app.Repositories.UserRepository import get_user_db
+from app.Schemas.user import UserCreate
+from app.Services.UserService import get_user_manager
+from config.database import AsyncSessionLocal
+
+async def create_user(email: str, full_name: str, password: str, is_superuser: bool):
+    async with AsyncSessionLocal() as session:
+        async for user_db in get_user_db(session):
+            async for user_manager in get_user_manager(user_db):
+                return await user_manager.create(
+                    UserCreate(email=email, full_name=full_name, password=password, is_superuser=is_superuser)
+                )
+
+def main():
+    parser = argparse.ArgumentParser(description="Create a user account")
+    parser.add_argument("email")
+    parser.add_argument("--full-name", required=True)
+    parser.add_argument("--superuser", action="store_true")
+    args = parser.parse_args()
+
+    password = getpass.getpass("Password: ")
+    if password != getpass.getpass("Repeat password: "):
+        parser.error("passwords do not match")
+
+    try:
+        user = asyncio.run(create_user(args.email, args.full_name, password, args.superuser))
+    except UserAlreadyExists:
+        parser.error(f"user {args.email} already exists")
+
+    role = "superuser" if user.is_superuser else "user"
+    print(f"Created {role} {user.email} (id {user.id}).")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""Rebuild the campaign_stats rollup from the influencers table.
+
+Usage:
+    python -m app.Console.Commands.RebuildCampaignStats [--client-id ID]
+"""
+import argparse
+from config.database import SessionLocal
+from app.Services.CampaignStatService import CampaignStatService
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the campaign_stats rollup")
+    parser.add_argument("--client-id", type=int, default=None, help="Only rebuild this client's buckets")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        buckets = CampaignStatService(db).rebuild(args.client_id)
+    finally:
+        db.close()
+
+    scope = f"client {args.client_id}" if args.client_id is not None else "all clients"
+    print(f"Rebuilt {buckets} campaign_stats buckets for {scope}.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Run the campaign loop over simulated profiles, without a browser.
+
+Usage:
+    python -m app.Console.Commands.SimulateCampaign [--profiles N] [--seed S]
+        [--persist --client-id ID] [--profile-out FILE]
+
+Browser latencies and the pause between influencers advance a virtual clock,
+so the report shows how long the campaign would take for real while the
+run itself only costs the non-browser overhead. With --persist, influencers
+and outcomes are written to the database inside a transaction that is
+rolled back at the end.
+"""
+import argparse
+import asyncio
+import cProfile
+import time
+from collections import Counter
+from sqlalchemy.orm import Session
+from app.Models.Influencer import Influencer
+from app.Services.CampaignService import CampaignService
+from app.Services.Instagram.Drivers.SimulatedDriver import SimulatedDriver
+from config.database import engine
+from config.settings import MESSAGE_DELAY_MIN, MESSAGE_DELAY_MAX
+
+async def simulate(db, influencers, seed):
+    driver = SimulatedDriver(seed=seed)
+    campaign = CampaignService(
+        db, driver, "Simulated message",
+        delay_range=(MESSAGE_DELAY_MIN, MESSAGE_DELAY_MAX),
+        sleep=driver.clock.sleep,
+    )
+    async with driver:
+        results = await campaign.run(influencers)
+    return driver, results
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a campaign without a browser")
+    parser.add_argument("--profiles", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--persist", action="store_true", help="Exercise DB writes (rolled back afterwards)")
+    parser.add_argument("--client-id", type=int, default=None, help="Existing client to attach influencers to")
+    parser.add_argument("--profile-out", default=None, help="Write cProfile stats to this file")
+    args = parser.parse_args()
+
+    if args.persist and args.client_id is None:
+        parser.error("--persist requires --client-id")
+
+    connection = None
+    db = None
+    if args.persist:
+        # Commits inside the campaign become savepoint releases; the outer
+        # transaction is rolled back so nothing is kept. The campaign commits
+        # once per influencer; expiring every loaded row on each commit would
+        # make the run quadratic.
+        connection = engine.connect()
+        outer = connection.begin()
+        db = Session(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+
+    influencers = [
+        Influencer(id=None if args.persist else i, username=f"sim_{i}", client_id=args.client_id)
+        for i in range(1, args.profiles + 1)
+    ]
+    if db is not None:
+        db.add_all(influencers)
+        db.flush()
+
+    profiler = cProfile.Profile() if args.profile_out else None
+    started = time.perf_counter()
+    try:
+        if profiler:
+            profiler.enable()
+        driver, results = asyncio.run(simulate(db, influencers, args.seed))
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile_out)
+    finally:
+        if connection is not None:
+            db.close()
+            outer.rollback()
+            connection.close()
+    wall = time.perf_counter() - started
+
+    outcomes = Counter(r["sent_via"] or r["error_code"] for r in results)
+    print(f"Profiles: {len(results)}")
+    print(f"Wall time: {wall:.2f}s ({len(results) / wall:.0f} profiles/s)")
+    print(f"Simulated campaign time: {driver.clock.elapsed / 3600:.1f}h")
+    print(f"Driver calls: {dict(driver.calls)}")
+    for outcome, count in outcomes.most_common():
+        print(f"  {outcome}: {count}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+from fastapi import Request
+from fastapi_users import FastAPIUsers
+from fastapi_users.authentication import AuthenticationBackend, BearerTransport
+from app.Models.User import User
+from app.Services.UserService import CachedJWTStrategy, get_user_manager
+from config.settings import JWT_SECRET, JWT_LIFETIME_SECONDS
+
+bearer_transport = BearerTransport(tokenUrl="api/v0/auth/jwt/login")
+
+# Requests that may change data resolve the user from the DB, not the cache
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+def get_jwt_strategy(request: Request):
+    return CachedJWTStrategy(
+        secret=JWT_SECRET,
+        lifetime_seconds=JWT_LIFETIME_SECONDS,
+        use_cache=request.method in SAFE_METHODS,
+    )
+
+auth_backend = AuthenticationBackend(
+    name="jwt",
+    transport=bearer_transport,
+    get_strategy=get_jwt_strategy,
+)
+
+fastapi_users = FastAPIUsers[User, int](get_user_manager, [auth_backend])
+
+current_active_user = fastapi_users.current_user(active=True)
+current_superuser = fastapi_users.current_user(active=True, superuser=True)
@@ -0,0 +1,72 @@
+from typing import Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.Services.BatchService import BatchService, is_in_flight, run_batch
+from app.Schemas.batch import BatchCreate, BatchUpdate, Batch
+from config.database import get_db
+from config.settings import ENABLE_AUTOMATION
+
+router = APIRouter()
+
+def get_batch_service(db: Session = Depends(get_db)):
+    return BatchService(db)
+
+@router.post("/", response_model=list[Batch])
+def create_batches(batch: BatchCreate, batch_service: BatchService = Depends(get_batch_service)):
+    batches = batch_service.create_batches(batch)
+    if batches is None:
+        raise HTTPException(status_code=404, detail="Client not found")
+    return batches
+
+@router.get("/{batch_id}", response_model=Batch)
+def read_batch(batch_id: int, batch_service: BatchService = Depends(get_batch_service)):
+    db_batch = batch_service.get_batch(batch_id)
+    if db_batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return db_batch
+
+@router.get("/", response_model=dict)
+def read_batches(
+    page: int = 1,
+    limit: int = 10,
+    client_id: Optional[int] = None,
+    batch_service: BatchService = Depends(get_batch_service)
+):
+    skip = (page - 1) * limit
+
+    batches, total_count = batch_service.get_batches(skip, limit, client_id)
+
+    return {
+        "batches": [Batch.model_validate(b) for b in batches],
+        "total_count": total_count,
+        "page": page,
+        "limit": limit
+    }
+
+@router.put("/{batch_id}", response_model=Batch)
+def update_batch(batch_id: int, batch: BatchUpdate, batch_service: BatchService = Depends(get_batch_service)):
+    db_batch = batch_service.update_batch(batch_id, batch.name)
+    if db_batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return db_batch
+
+@router.delete("/{batch_id}", response_model=Batch)
+def delete_batch(batch_id: int, batch_service: BatchService = Depends(get_batch_service)):
+    db_batch = batch_service.get_batch(batch_id)
+    if db_batch is not None and is_in_flight(db_batch):
+        raise HTTPException(status_code=409, detail="Batch is queued or running")
+    db_batch = batch_service.delete_batch(batch_id)
+    if db_batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return db_batch
+
+@router.post("/{batch_id}/run", response_model=Batch, status_code=202)
+def schedule_batch(batch_id: int, background_tasks: BackgroundTasks, batch_service: BatchService = Depends(get_batch_service)):
+    if not ENABLE_AUTOMATION:
+        raise HTTPException(status_code=503, detail="Automation is disabled on this server")
+    if batch_service.get_batch(batch_id) is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    if not batch_service.queue_batch(batch_id):
+        raise HTTPException(status_code=409, detail="Batch is already queued or running")
+    background_tasks.add_task(run_batch, batch_id)
+    return batch_service.get_batch(batch_id)
@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from app.Services.ClientService import ClientService
 from app.Schemas.client import ClientCreate, Client
+from app.Utils.Cache import cached_response
 from config.database import get_db
 
 router = APIRouter()
 
+client_list_adapter = TypeAdapter(list[Client])
+
 def get_client_service(db: Session = Depends(get_db)):
     return ClientService(db)
 
@@ -14,15 +18,25 @@ def create_client(client: ClientCreate, client_service: ClientService = Depends(
     return client_service.create_client(client)
 
 @router.get("/{client_id}", response_model=Client)
-def read_client(client_id: int, client_service: ClientService = Depends(get_client_service)):
-    db_client = client_service.get_client(client_id)
-    if db_client is None:
+def read_client(client_id: int, request: Request, client_service: ClientService = Depends(get_client_service)):
+    def build():
+        db_client = client_service.get_client(client_id)
+        if db_client is None:
+            return None
+        return Client.model_validate(db_client).model_dump_json().encode()
+
+    response = cached_response(request, "clients", ("read_client", client_id), build)
+    if response is None:
         raise HTTPException(status_code=404, detail="Client not found")
-    return db_client
+    return response
 
 @router.get("/", response_model=list[Client])
-def read_clients(skip: int = 0, limit: int = 10, client_service: ClientService = Depends(get_client_service)):
-    return client_service.get_clients(skip, limit)
+def read_clients(request: Request, skip: int = 0, limit: int = 10, client_service: ClientService = Depends(get_client_service)):
+    def build():
+        rows = client_service.get_clients(skip, limit)
+        return client_list_adapter.dump_json(client_list_adapter.validate_python(rows, from_attributes=True))
+
+    return cached_response(request, "clients", ("read_clients", skip, limit), build)
 
 @router.put("/{client_id}", response_model=Client)
 def update_client(client_id: int, client: ClientCreate, client_service: ClientService = Depends(get_client_service)):
@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.Services.InfluencerService import InfluencerService
+from app.Services.ExportService import ExportService
 from app.Schemas.influencer import InfluencerCreate, Influencer
+from app.Utils.Cache import cached_response
 from config.database import get_db
 
 router = APIRouter()
@@ -13,12 +17,72 @@ def get_influencer_service(db: Session = Depends(get_db)):
 def create_influencer(influencer: InfluencerCreate, influencer_service: InfluencerService = Depends(get_influencer_service)):
     return influencer_service.create_influencer(influencer)
 
+# Declared before /{influencer_id} so "search" is not parsed as an id
+@router.get("/search", response_model=dict)
+def search_influencers(
+    q: str = Query(..., min_length=1),
+    match: Literal["prefix", "fuzzy"] = "prefix",
+    client_id: Optional[int] = None,
+    message_status: Optional[bool] = None,
+    sent_via: Optional[str] = None,
+    error_code: Optional[str] = None,
+    cursor: Optional[str] = None,  # next_cursor from the previous page
+    limit: int = Query(10, ge=1, le=100),
+    influencer_service: InfluencerService = Depends(get_influencer_service)
+):
+    # Prefix results come newest first; fuzzy results best match first
+    try:
+        influencers, next_cursor = influencer_service.search_influencers(
+            q, match, client_id, message_status, sent_via, error_code, cursor, limit
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    influencers_data = [Influencer.model_validate(i) for i in influencers]
+
+    return {
+        "influencers": influencers_data,
+        "next_cursor": next_cursor,
+        "limit": limit
+    }
+
+@router.get("/export")
+def export_influencers(
+    client_id: Optional[int] = None,
+    batch_id: Optional[int] = None,
+    format: Literal["csv", "xlsx"] = "csv",
+):
+    export_service = ExportService(client_id, batch_id)
+    filename = "influencers"
+    if client_id is not None:
+        filename += f"-client-{client_id}"
+    if batch_id is not None:
+        filename += f"-batch-{batch_id}"
+
+    if format == "xlsx":
+        return StreamingResponse(
+            export_service.iter_xlsx(),
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.xlsx"'},
+        )
+    return StreamingResponse(
+        export_service.iter_csv(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}.csv"'},
+    )
+
 @router.get("/{influencer_id}", response_model=Influencer)
-def read_influencer(influencer_id: int, influencer_service: InfluencerService = Depends(get_influencer_service)):
-    db_influencer = influencer_service.get_influencer(influencer_id)
-    if db_influencer is None:
+def read_influencer(influencer_id: int, request: Request, influencer_service: InfluencerService = Depends(get_influencer_service)):
+    def build():
+        db_influencer = influencer_service.get_influencer(influencer_id)
+        if db_influencer is None:
+            return None
+        return Influencer.model_validate(db_influencer).model_dump_json().encode()
+
+    response = cached_response(request, "influencers", ("read_influencer", influencer_id), build)
+    if response is None:
         raise HTTPException(status_code=404, detail="Influencer not found")
-    return db_influencer
+    return response
 
 @router.get("/", response_model=dict)
 def read_influencers(
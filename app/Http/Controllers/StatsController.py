@@ -0,0 +1,22 @@
+import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from app.Services.CampaignStatService import CampaignStatService
+from app.Schemas.campaign_stat import CampaignStat
+from config.database import get_db
+
+router = APIRouter()
+
+def get_campaign_stat_service(db: Session = Depends(get_db)):
+    return CampaignStatService(db)
+
+@router.get("/", response_model=list[CampaignStat])
+def read_stats(
+    client_id: Optional[int] = None,
+    date_from: Optional[datetime.date] = None,
+    date_to: Optional[datetime.date] = None,
+    campaign_stat_service: CampaignStatService = Depends(get_campaign_stat_service)
+):
+    # Served from the campaign_stats rollup, never from the influencers table
+    return campaign_stat_service.get_stats(client_id, date_from, date_to)
@@ -1,10 +1,34 @@
-from sqlalchemy import Column, Integer, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, Integer, String, ForeignKey, TIMESTAMP
+from sqlalchemy.orm import relationship
 from config.database import Base
 from datetime import datetime
 
+# pending -> queued -> running -> completed | failed
+BATCH_PENDING = "pending"
+BATCH_QUEUED = "queued"
+BATCH_RUNNING = "running"
+BATCH_COMPLETED = "completed"
+BATCH_FAILED = "failed"
+
 class Batch(Base):
     __tablename__ = "batches"
 
     id = Column(Integer, primary_key=True, index=True)
-    client_id = Column(Integer, ForeignKey("clients.id"))
+    client_id = Column(Integer, ForeignKey("clients.id"), index=True)
+    name = Column(String, nullable=False)
+    size = Column(Integer, nullable=False)
+    status = Column(String, nullable=False, default=BATCH_PENDING, server_default=BATCH_PENDING)
+
+    # Maintained incrementally as outcomes are recorded
+    total_count = Column(Integer, nullable=False, default=0, server_default="0")
+    processed_count = Column(Integer, nullable=False, default=0, server_default="0")
+    sent_count = Column(Integer, nullable=False, default=0, server_default="0")
+    failed_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
+    started_at = Column(TIMESTAMP, nullable=True)
+    completed_at = Column(TIMESTAMP, nullable=True)
+
+    client = relationship('Client')
+    influencers = relationship('Influencer', back_populates='batch')
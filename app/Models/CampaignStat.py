@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, Date, UniqueConstraint
+from config.database import Base
+
+class CampaignStat(Base):
+    __tablename__ = 'campaign_stats'
+
+    id = Column(Integer, primary_key=True, index=True)
+    client_id = Column(Integer, ForeignKey('clients.id'), nullable=False)
+    day = Column(Date, nullable=False)
+    # NULL sent_via / error_code are stored as '' so they take part in the unique key
+    sent_via = Column(String, nullable=False, default='', server_default='')
+    message_status = Column(Boolean, nullable=False)
+    error_code = Column(String, nullable=False, default='', server_default='')
+    count = Column(Integer, nullable=False, default=0, server_default='0')
+
+    __table_args__ = (
+        UniqueConstraint(
+            'client_id', 'day', 'sent_via', 'message_status', 'error_code',
+            name='uq_campaign_stats_bucket',
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, DateTime, Text, func
+from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, DateTime, Text, Index, func
 from sqlalchemy.orm import relationship
 from config.database import Base
 
@@ -8,13 +8,34 @@ class Influencer(Base):
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String, index=True)
     client_id = Column(Integer, ForeignKey('clients.id'))
+    batch_id = Column(Integer, ForeignKey('batches.id'), nullable=True, index=True)
     sent_via = Column(String, default='None')
     message_status = Column(Boolean, default=False)
     message_sent_at = Column(DateTime, nullable=True)
     error_code = Column(String, nullable=True)
     error_reason = Column(String, nullable=True)  # New field for storing reason
+    processed_at = Column(DateTime, nullable=True)  # When the last outcome was recorded
 
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     client = relationship('Client', back_populates='influencers')
+    batch = relationship('Batch', back_populates='influencers')
+
+    __table_args__ = (
+        # Trigram index for fuzzy (similarity) username search, requires pg_trgm
+        Index(
+            'ix_influencers_username_trgm',
+            'username',
+            postgresql_using='gin',
+            postgresql_ops={'username': 'gin_trgm_ops'},
+        ),
+        # Case-insensitive prefix search: lower(username) LIKE 'abc%'
+        Index(
+            'ix_influencers_username_lower_prefix',
+            func.lower(username).label('username_lower'),
+            postgresql_ops={'username_lower': 'text_pattern_ops'},
+        ),
+        # Filtered listing / keyset pagination within a client
+        Index('ix_influencers_client_id_id', 'client_id', 'id'),
+    )
@@ -1,7 +1,8 @@
 from fastapi_users.db import SQLAlchemyBaseUserTable
 from config.database import Base
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Integer, String
 
-class User(Base, SQLAlchemyBaseUserTable):
+class User(SQLAlchemyBaseUserTable[int], Base):
     __tablename__ = "users"
+    id = Column(Integer, primary_key=True, index=True)
     full_name = Column(String, nullable=False)
@@ -1,2 +1,4 @@
 from .Influencer import Influencer
-from .Client import Client
\ No newline at end of file
+from .Client import Client
+from .CampaignStat import CampaignStat
+from .Batch import Batch
@@ -0,0 +1,188 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import and_, desc, func, or_, update
+from sqlalchemy.orm import Session
+from app.Models.Batch import Batch, BATCH_COMPLETED, BATCH_FAILED, BATCH_RUNNING
+from app.Models.Influencer import Influencer
+
+class BatchRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create_batches(self, client_id: int, batch_size: int, name_prefix: str):
+        # Hand out the client's unassigned influencers, in id order, one
+        # batch at a time; each step is an indexed UPDATE ... LIMIT that
+        # resumes after the last id assigned instead of rescanning from the
+        # start of the client's range.
+        batches = []
+        last_id = 0
+        # Continue numbering after the client's existing batches
+        numbered = self.db.query(Batch).filter(Batch.client_id == client_id).count()
+        while True:
+            number = numbered + len(batches) + 1
+            batch = Batch(client_id=client_id, name=f"{name_prefix} #{number}", size=batch_size)
+            self.db.add(batch)
+            self.db.flush()
+
+            while True:
+                unassigned = self.db.query(Influencer.id)\
+                    .filter(Influencer.client_id == client_id, Influencer.batch_id.is_(None), Influencer.id > last_id)
+                chunk = unassigned.order_by(Influencer.id).limit(batch_size).scalar_subquery()
+                assigned_ids = self.db.execute(
+                    update(Influencer)
+                    # Re-checked after any row-lock wait, so a concurrent
+                    # create_batches cannot take rows this one already assigned
+                    .where(Influencer.id.in_(chunk), Influencer.batch_id.is_(None))
+                    .values(batch_id=batch.id)
+                    .returning(Influencer.id)
+                    .execution_options(synchronize_session=False)
+                ).scalars().all()
+                assigned = len(assigned_ids)
+                if assigned:
+                    last_id = max(assigned_ids)
+                    break
+                # Nothing assigned but rows left means the whole chunk was
+                # taken concurrently; try again against the fresh snapshot
+                if not self.db.query(unassigned.exists()).scalar():
+                    break
+
+            if assigned == 0:
+                self.db.delete(batch)
+                break
+
+            # Outcomes recorded before batching count towards the new batch
+            processed, sent = self.db.query(
+                func.count(Influencer.processed_at),
+                func.count().filter(Influencer.message_status.is_(True)),
+            ).filter(Influencer.batch_id == batch.id).one()
+            batch.total_count = assigned
+            batch.processed_count = processed
+            batch.sent_count = sent
+            batch.failed_count = processed - sent
+            batches.append(batch)
+
+        self.db.commit()
+        for batch in batches:
+            self.db.refresh(batch)
+        return batches
+
+    def get_batch(self, batch_id: int):
+        return self.db.query(Batch).filter(Batch.id == batch_id).first()
+
+    def get_batches(self, skip: int, limit: int, client_id: Optional[int] = None):
+        query = self.db.query(Batch)
+        if client_id is not None:
+            query = query.filter(Batch.client_id == client_id)
+        total_count = query.count()
+        batches = query.order_by(desc(Batch.id)).offset(skip).limit(limit).all()
+        return batches, total_count
+
+    def get_pending_influencers(self, batch_id: int):
+        return self.db.query(Influencer)\
+            .filter(Influencer.batch_id == batch_id)\
+            .filter(Influencer.message_status.isnot(True))\
+            .order_by(Influencer.id)\
+            .all()
+
+    def update_batch(self, batch_id: int, name: str):
+        db_batch = self.get_batch(batch_id)
+        if db_batch:
+            db_batch.name = name
+            self.db.commit()
+            self.db.refresh(db_batch)
+        return db_batch
+
+    def delete_batch(self, batch_id: int):
+        db_batch = self.get_batch(batch_id)
+        if db_batch:
+            # Influencers go back to the client's unassigned pool
+            self.db.execute(
+                update(Influencer)
+                .where(Influencer.batch_id == batch_id)
+                .values(batch_id=None)
+                .execution_options(synchronize_session=False)
+            )
+            self.db.delete(db_batch)
+            self.db.commit()
+        return db_batch
+
+    def delete_client_batches(self, client_id: int):
+        # Runs in the caller's transaction; the caller commits
+        client_batches = self.db.query(Batch.id).filter(Batch.client_id == client_id).scalar_subquery()
+        self.db.execute(
+            update(Influencer)
+            .where(Influencer.batch_id.in_(client_batches))
+            .values(batch_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.query(Batch)\
+            .filter(Batch.client_id == client_id)\
+            .delete(synchronize_session=False)
+
+    def _status_values(self, status: str):
+        now = datetime.utcnow()
+        values = {"status": status, "updated_at": now}
+        if status == BATCH_RUNNING:
+            values["started_at"] = now
+            values["completed_at"] = None
+        elif status in (BATCH_COMPLETED, BATCH_FAILED):
+            values["completed_at"] = now
+        return values
+
+    def claim_batch(self, batch_id: int, from_statuses, to_status: str, stale_statuses=(), stale_before: Optional[datetime] = None):
+        # Compare-and-set on status so two requests cannot both schedule a batch.
+        # Batches in stale_statuses whose heartbeat (updated_at) is older than
+        # stale_before are claimable too: their worker is gone.
+        claimable = Batch.status.in_(from_statuses)
+        if stale_statuses and stale_before is not None:
+            claimable = or_(claimable, and_(Batch.status.in_(stale_statuses), Batch.updated_at < stale_before))
+        claimed = self.db.execute(
+            update(Batch)
+            .where(Batch.id == batch_id, claimable)
+            .values(**self._status_values(to_status))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        self.db.commit()
+        return claimed == 1
+
+    def set_status(self, batch_id: int, status: str):
+        self.db.execute(
+            update(Batch)
+            .where(Batch.id == batch_id)
+            .values(**self._status_values(status))
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+
+    def apply_counts(self, batch_id: int, total: int = 0, processed: int = 0, sent: int = 0, failed: int = 0):
+        # Relative UPDATE in the caller's transaction; the caller commits
+        self.db.execute(
+            update(Batch)
+            .where(Batch.id == batch_id)
+            .values(
+                total_count=Batch.total_count + total,
+                processed_count=Batch.processed_count + processed,
+                sent_count=Batch.sent_count + sent,
+                failed_count=Batch.failed_count + failed,
+                updated_at=datetime.utcnow(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def remove_influencer(self, influencer: Influencer):
+        """Take influencer and its recorded outcome out of its batch's counters.
+
+        Clears influencer.batch_id; runs in the caller's transaction.
+        """
+        if influencer.batch_id is None:
+            return
+        was_processed = influencer.processed_at is not None
+        was_sent = was_processed and bool(influencer.message_status)
+        self.apply_counts(
+            influencer.batch_id,
+            total=-1,
+            processed=-int(was_processed),
+            sent=-int(was_sent),
+            failed=-int(was_processed and not was_sent),
+        )
+        influencer.batch_id = None
@@ -0,0 +1,104 @@
+import datetime
+from typing import Optional
+from sqlalchemy import cast, Date, func, literal
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.Models.CampaignStat import CampaignStat
+from app.Models.Influencer import Influencer
+
+class CampaignStatRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def increment(
+        self,
+        client_id: int,
+        day: datetime.date,
+        sent_via: Optional[str],
+        message_status: bool,
+        error_code: Optional[str],
+        delta: int = 1,
+    ):
+        # Upsert so concurrent workers never race on creating the same bucket.
+        # Runs in the caller's transaction; the caller commits.
+        stmt = insert(CampaignStat).values(
+            client_id=client_id,
+            day=day,
+            sent_via=sent_via or '',
+            message_status=bool(message_status),
+            error_code=error_code or '',
+            count=delta,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint='uq_campaign_stats_bucket',
+            set_={'count': CampaignStat.count + stmt.excluded.count},
+        )
+        self.db.execute(stmt)
+
+    def increment_for(self, influencer: Influencer, delta: int):
+        """Add (or with a negative delta remove) influencer's recorded outcome."""
+        if influencer.processed_at is None or influencer.client_id is None:
+            return
+        self.increment(
+            influencer.client_id,
+            influencer.processed_at.date(),
+            influencer.sent_via,
+            influencer.message_status,
+            influencer.error_code,
+            delta=delta,
+        )
+
+    def delete_client_stats(self, client_id: int):
+        # Runs in the caller's transaction; the caller commits
+        self.db.query(CampaignStat)\
+            .filter(CampaignStat.client_id == client_id)\
+            .delete(synchronize_session=False)
+
+    def get_stats(
+        self,
+        client_id: Optional[int] = None,
+        date_from: Optional[datetime.date] = None,
+        date_to: Optional[datetime.date] = None,
+    ):
+        query = self.db.query(CampaignStat).filter(CampaignStat.count != 0)
+        if client_id is not None:
+            query = query.filter(CampaignStat.client_id == client_id)
+        if date_from is not None:
+            query = query.filter(CampaignStat.day >= date_from)
+        if date_to is not None:
+            query = query.filter(CampaignStat.day <= date_to)
+        return query.order_by(
+            CampaignStat.client_id, CampaignStat.day, CampaignStat.sent_via,
+            CampaignStat.message_status, CampaignStat.error_code
+        ).all()
+
+    def rebuild(self, client_id: Optional[int] = None):
+        # Recompute buckets from the influencers table in one transaction, so
+        # readers see either the old or the rebuilt rollup, never a partial one.
+        delete_query = self.db.query(CampaignStat)
+        if client_id is not None:
+            delete_query = delete_query.filter(CampaignStat.client_id == client_id)
+        delete_query.delete(synchronize_session=False)
+
+        day = cast(Influencer.processed_at, Date)
+        sent_via = func.coalesce(Influencer.sent_via, literal(''))
+        message_status = func.coalesce(Influencer.message_status, literal(False))
+        error_code = func.coalesce(Influencer.error_code, literal(''))
+        source = self.db.query(
+            Influencer.client_id, day, sent_via, message_status, error_code, func.count()
+        ).filter(
+            Influencer.processed_at.isnot(None),
+            Influencer.client_id.isnot(None),
+        )
+        if client_id is not None:
+            source = source.filter(Influencer.client_id == client_id)
+        source = source.group_by(Influencer.client_id, day, sent_via, message_status, error_code)
+
+        result = self.db.execute(
+            insert(CampaignStat).from_select(
+                ['client_id', 'day', 'sent_via', 'message_status', 'error_code', 'count'],
+                source.statement,
+            )
+        )
+        self.db.commit()
+        return result.rowcount
@@ -1,6 +1,9 @@
 from sqlalchemy.orm import Session
 from app.Models.Client import Client
 from app.Schemas.client import ClientCreate
+from app.Repositories.BatchRepository import BatchRepository
+from app.Repositories.CampaignStatRepository import CampaignStatRepository
+from app.Utils.Cache import response_cache
 
 class ClientRepository:
     def __init__(self, db: Session):
@@ -11,6 +14,7 @@ class ClientRepository:
         self.db.add(db_client)
         self.db.commit()
         self.db.refresh(db_client)
+        response_cache.invalidate("clients")
         return db_client
 
     def get_client(self, client_id: int):
@@ -26,11 +30,16 @@ class ClientRepository:
                 setattr(db_client, key, value)
             self.db.commit()
             self.db.refresh(db_client)
+            response_cache.invalidate("clients")
         return db_client
 
     def delete_client(self, client_id: int):
         db_client = self.get_client(client_id)
         if db_client:
+            # campaign_stats and batches rows reference the client and would block the delete
+            CampaignStatRepository(self.db).delete_client_stats(client_id)
+            BatchRepository(self.db).delete_client_batches(client_id)
             self.db.delete(db_client)
             self.db.commit()
+            response_cache.invalidate("clients", "influencers")
         return db_client
@@ -1,8 +1,12 @@
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy.orm import Session, joinedload
 from app.Models.Influencer import Influencer
 from app.Schemas.influencer import InfluencerCreate
 from app.Models.Client import Client 
-from sqlalchemy import desc
+from app.Repositories.BatchRepository import BatchRepository
+from app.Repositories.CampaignStatRepository import CampaignStatRepository
+from app.Utils.Cache import response_cache
+from sqlalchemy import Float, and_, cast, desc, func, or_
 
 class InfluencerRepository:
     def __init__(self, db: Session):
@@ -13,6 +17,8 @@ class InfluencerRepository:
         self.db.add(db_influencer)
         self.db.commit()
         self.db.refresh(db_influencer)
+        # Clients embed their influencers, so both namespaces go stale
+        response_cache.invalidate("influencers", "clients")
         return db_influencer
 
     def get_influencer(self, influencer_id: int):
@@ -43,18 +49,140 @@ class InfluencerRepository:
         
         return influencers, total_count
 
+    def search_influencers(
+        self,
+        q: str,
+        match: str = "prefix",
+        client_id: Optional[int] = None,
+        message_status: Optional[bool] = None,
+        sent_via: Optional[str] = None,
+        error_code: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ):
+        """Keyset-paginated username search.
+
+        Prefix matches are ordered by id, newest first, and the cursor is the
+        last id seen. Fuzzy matches are ranked by trigram similarity, then id,
+        and the cursor is "<similarity>:<id>" of the last row. Raises
+        ValueError on a malformed cursor.
+        """
+        # Prefix search hits the lower(username) text_pattern_ops index,
+        # fuzzy search hits the pg_trgm GIN index through the % operator.
+        if match == "fuzzy":
+            condition = Influencer.username.op('%')(q)
+            # similarity() returns real; widen it to double precision so the
+            # cursor value compares equal to the score it was read from
+            score = cast(func.similarity(Influencer.username, q), Float)
+        else:
+            # Backslash is Postgres' default LIKE escape; keep the pattern a
+            # plain prefix so the planner can turn it into an index range scan.
+            escaped = q.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            condition = func.lower(Influencer.username).like(f"{escaped}%")
+            score = None
+
+        columns = [Influencer, Client.name.label('client_name')]
+        if score is not None:
+            columns.append(score.label('score'))
+        query = self.db.query(*columns).join(
+            Client,
+            Influencer.client_id == Client.id
+        ).filter(condition)
+
+        if client_id is not None:
+            query = query.filter(Influencer.client_id == client_id)
+        if message_status is not None:
+            query = query.filter(Influencer.message_status == message_status)
+        if sent_via is not None:
+            query = query.filter(Influencer.sent_via == sent_via)
+        if error_code is not None:
+            query = query.filter(Influencer.error_code == error_code)
+
+        # Keyset pagination: continue strictly after the last row seen
+        if score is None:
+            if cursor is not None:
+                query = query.filter(Influencer.id < int(cursor))
+            query = query.order_by(desc(Influencer.id))
+        else:
+            if cursor is not None:
+                last_score, last_id = cursor.split(':')
+                last_score, last_id = float(last_score), int(last_id)
+                query = query.filter(or_(
+                    score < last_score,
+                    and_(score == last_score, Influencer.id < last_id),
+                ))
+            query = query.order_by(desc(score), desc(Influencer.id))
+
+        # Fetch one extra row to know whether another page exists
+        results = query.limit(limit + 1).all()
+
+        influencers = []
+        for row in results[:limit]:
+            influencer_dict = row.Influencer.__dict__
+            influencer_dict['client_name'] = row.client_name
+            influencers.append(influencer_dict)
+
+        next_cursor = None
+        if len(results) > limit:
+            last = results[limit - 1]
+            if score is None:
+                next_cursor = str(last.Influencer.id)
+            else:
+                # repr() round-trips a double exactly, so the next page
+                # compares against the same similarity value
+                next_cursor = f"{last.score!r}:{last.Influencer.id}"
+        return influencers, next_cursor
+
+    def iter_export_rows(self, client_id: Optional[int] = None, batch_id: Optional[int] = None, chunk_size: int = 1000):
+        # Plain column tuples through a server-side cursor: rows are fetched
+        # chunk_size at a time and never materialised as ORM objects.
+        query = self.db.query(
+            Influencer.id,
+            Influencer.username,
+            Client.name.label('client_name'),
+            Influencer.message_status,
+            Influencer.sent_via,
+            Influencer.error_code,
+            Influencer.error_reason,
+            Influencer.message_sent_at,
+            Influencer.processed_at,
+            Influencer.created_at,
+            Influencer.updated_at,
+        ).join(
+            Client,
+            Influencer.client_id == Client.id
+        )
+        if client_id is not None:
+            query = query.filter(Influencer.client_id == client_id)
+        if batch_id is not None:
+            query = query.filter(Influencer.batch_id == batch_id)
+        # yield_per also turns on stream_results (a named cursor on psycopg2)
+        return query.order_by(Influencer.id).yield_per(chunk_size)
+
     def update_influencer(self, influencer_id: int, influencer: InfluencerCreate):
         db_influencer = self.get_influencer(influencer_id)
         if db_influencer:
             db_influencer.username = influencer.username
-            db_influencer.client_id = influencer.client_id
+            if db_influencer.client_id != influencer.client_id:
+                # The recorded outcome moves to the new client's rollup
+                stat_repo = CampaignStatRepository(self.db)
+                stat_repo.increment_for(db_influencer, -1)
+                db_influencer.client_id = influencer.client_id
+                stat_repo.increment_for(db_influencer, 1)
+                # Batches belong to a single client
+                BatchRepository(self.db).remove_influencer(db_influencer)
             self.db.commit()
             self.db.refresh(db_influencer)
+            response_cache.invalidate("influencers", "clients")
         return db_influencer
 
     def delete_influencer(self, influencer_id: int):
         db_influencer = self.get_influencer(influencer_id)
         if db_influencer:
+            # Take the deleted outcome back out of the rollup
+            CampaignStatRepository(self.db).increment_for(db_influencer, -1)
+            BatchRepository(self.db).remove_influencer(db_influencer)
             self.db.delete(db_influencer)
             self.db.commit()
+            response_cache.invalidate("influencers", "clients")
         return db_influencer
@@ -0,0 +1,29 @@
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
+import datetime
+
+class BatchCreate(BaseModel):
+    client_id: int
+    # Unassigned influencers of the client are split into batches of this size
+    batch_size: int = Field(..., gt=0)
+    name_prefix: Optional[str] = None
+
+class BatchUpdate(BaseModel):
+    name: str
+
+class Batch(BaseModel):
+    id: int
+    client_id: int
+    name: str
+    size: int
+    status: str
+    total_count: int
+    processed_count: int
+    sent_count: int
+    failed_count: int
+    created_at: Optional[datetime.datetime] = None
+    updated_at: Optional[datetime.datetime] = None
+    started_at: Optional[datetime.datetime] = None
+    completed_at: Optional[datetime.datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, ConfigDict
+import datetime
+
+class CampaignStat(BaseModel):
+    client_id: int
+    day: datetime.date
+    sent_via: str
+    message_status: bool
+    error_code: str
+    count: int
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,11 @@
+from fastapi_users import schemas
+from typing import Optional
+
+class UserRead(schemas.BaseUser[int]):
+    full_name: str
+
+class UserCreate(schemas.BaseUserCreate):
+    full_name: str
+
+class UserUpdate(schemas.BaseUserUpdate):
+    full_name: Optional[str] = None
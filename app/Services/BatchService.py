@@ -0,0 +1,86 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.Models.Batch import BATCH_PENDING, BATCH_QUEUED, BATCH_RUNNING, BATCH_COMPLETED, BATCH_FAILED
+from app.Repositories.BatchRepository import BatchRepository
+from app.Repositories.ClientRepository import ClientRepository
+from app.Schemas.batch import BatchCreate
+from app.Services.CampaignService import CampaignService, MESSAGE
+from app.Utils.Logger import get_logger, log_context
+from config.database import SessionLocal
+from config.settings import INSTAGRAM_USERNAME, BATCH_STALE_AFTER_SECONDS
+
+logger = get_logger(__name__)
+
+# A batch can be (re)scheduled or deleted from any state except while it is in flight
+SCHEDULABLE_STATUSES = (BATCH_PENDING, BATCH_COMPLETED, BATCH_FAILED)
+IN_FLIGHT_STATUSES = (BATCH_QUEUED, BATCH_RUNNING)
+
+def stale_before():
+    """In-flight batches not updated since this time lost their worker.
+
+    Running batches bump updated_at with every recorded outcome, so this
+    only catches batches whose worker died or restarted.
+    """
+    return datetime.utcnow() - timedelta(seconds=BATCH_STALE_AFTER_SECONDS)
+
+def is_in_flight(batch) -> bool:
+    return batch.status in IN_FLIGHT_STATUSES and batch.updated_at is not None and batch.updated_at >= stale_before()
+
+class BatchService:
+    def __init__(self, db: Session):
+        self.batch_repo = BatchRepository(db)
+        self.client_repo = ClientRepository(db)
+
+    def create_batches(self, batch: BatchCreate):
+        if self.client_repo.get_client(batch.client_id) is None:
+            return None
+        name_prefix = batch.name_prefix or f"Client {batch.client_id} batch"
+        return self.batch_repo.create_batches(batch.client_id, batch.batch_size, name_prefix)
+
+    def get_batch(self, batch_id: int):
+        return self.batch_repo.get_batch(batch_id)
+
+    def get_batches(self, skip: int = 0, limit: int = 10, client_id: Optional[int] = None):
+        return self.batch_repo.get_batches(skip, limit, client_id)
+
+    def update_batch(self, batch_id: int, name: str):
+        return self.batch_repo.update_batch(batch_id, name)
+
+    def delete_batch(self, batch_id: int):
+        return self.batch_repo.delete_batch(batch_id)
+
+    def queue_batch(self, batch_id: int):
+        return self.batch_repo.claim_batch(
+            batch_id, SCHEDULABLE_STATUSES, BATCH_QUEUED,
+            stale_statuses=IN_FLIGHT_STATUSES, stale_before=stale_before(),
+        )
+
+async def run_batch(batch_id: int):
+    """Send messages to a queued batch's unsent influencers.
+
+    Runs outside the request (as a background task), so it owns its session.
+    Batches run independently of each other, each with its own browser.
+    """
+    from app.Services.Instagram.Drivers.PlaywrightDriver import PlaywrightDriver
+
+    db = SessionLocal()
+    batch_repo = BatchRepository(db)
+    try:
+        if not batch_repo.claim_batch(batch_id, (BATCH_QUEUED,), BATCH_RUNNING):
+            return
+
+        influencers = batch_repo.get_pending_influencers(batch_id)
+        with log_context(job_id=uuid.uuid4().hex, account_id=INSTAGRAM_USERNAME):
+            logger.info("Running batch %s with %s influencers", batch_id, len(influencers))
+            if influencers:
+                async with PlaywrightDriver() as driver:
+                    await CampaignService(db, driver, MESSAGE).run(influencers)
+        batch_repo.set_status(batch_id, BATCH_COMPLETED)
+    except Exception:
+        logger.exception("Batch %s failed", batch_id)
+        db.rollback()
+        batch_repo.set_status(batch_id, BATCH_FAILED)
+    finally:
+        db.close()
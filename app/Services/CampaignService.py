@@ -0,0 +1,76 @@
+import asyncio
+import datetime
+import random
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.Services.CampaignStatService import CampaignStatService
+from app.Services.Instagram.Drivers.BrowserDriver import BrowserDriver
+from app.Utils.Cache import response_cache
+from app.Utils.Logger import get_logger, log_context
+from config.settings import MESSAGE_DELAY_MIN, MESSAGE_DELAY_MAX
+
+logger = get_logger(__name__)
+
+MESSAGE = """Hello,\n\nI’m Sarah from Echooo.AI, an Influencer Management Platform working with brands like Nestlé, Packages Group, Sutas Dairy, HerBeauty, Moyuum, and Fasset across Pakistan and the MENA region.\n\nNestlé is looking for influencers to help create awareness about child malnutrition in Pakistan through a paid collaboration. The scope includes:\n\n\u2022  1 Instagram Reel or YouTube Video (platform based on preference)\n\u2022  3–4 Instagram Stories or 1–2 YouTube Shorts\n\u2022  Cross-posting on all your social media handles\n\nPayment: Processed within 30–45 days after content goes live (15% platform fee applies).\n\nIf interested, please share your charges, availability, and social media URLs.\n\nLooking forward to your response!\n\nBest,\nSarah\nEchooo.AI"""
+
+class CampaignService:
+    """Runs the outreach flow for a list of influencers on a BrowserDriver.
+
+    With db=None outcomes are only returned, not persisted. sleep paces the
+    pause between influencers and can be swapped for a virtual clock.
+    """
+
+    def __init__(
+        self,
+        db: Optional[Session],
+        driver: BrowserDriver,
+        message: str,
+        delay_range=(MESSAGE_DELAY_MIN, MESSAGE_DELAY_MAX),
+        sleep=asyncio.sleep,
+    ):
+        self.db = db
+        self.driver = driver
+        self.message = message
+        self.delay_range = delay_range
+        self.sleep = sleep
+        self.stat_service = CampaignStatService(db) if db is not None else None
+
+    async def run(self, influencers):
+        results = []
+        for influencer in influencers:
+            with log_context(influencer_id=influencer.id):
+                results.append(await self.process(influencer))
+                delay = random.uniform(*self.delay_range)
+                logger.debug("Sleeping for %.2f seconds", delay)
+                await self.sleep(delay)
+        return results
+
+    async def process(self, influencer):
+        username = influencer.username
+        logger.info("Visiting profile %s", username)
+        await self.driver.navigate(username)
+
+        profile = await self.driver.probe_profile(username)
+        sent_via = None
+        sent_at = None
+
+        if not profile["available"]:
+            status, error_code, error_reason = False, "PROFILE_NOT_FOUND", "Instagram profile does not exist or is restricted"
+        elif profile["has_story"]:
+            status, error_code, error_reason = await self.driver.open_story()
+            if status:
+                status, error_code, error_reason = await self.driver.reply_to_story(self.message)
+            if status:
+                sent_via = "Story"
+                sent_at = datetime.datetime.now().isoformat()
+        else:
+            status, error_code, error_reason = False, "STORY_NOT_FOUND", "No active story"
+
+        if self.db is not None:
+            # Updates the influencer and the campaign_stats rollup in the same transaction
+            self.stat_service.record_outcome(influencer, status, sent_via, error_code, error_reason, sent_at)
+            self.db.commit()
+            response_cache.invalidate("influencers")
+
+        logger.info("Outcome for %s: status=%s sent_via=%s error_code=%s", username, status, sent_via, error_code)
+        return {"username": username, "status": status, "sent_via": sent_via, "error_code": error_code, "error_reason": error_reason}
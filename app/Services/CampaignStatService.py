@@ -0,0 +1,66 @@
+import datetime
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.Models.Influencer import Influencer
+from app.Repositories.BatchRepository import BatchRepository
+from app.Repositories.CampaignStatRepository import CampaignStatRepository
+
+class CampaignStatService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.campaign_stat_repo = CampaignStatRepository(db)
+        self.batch_repo = BatchRepository(db)
+
+    def record_outcome(
+        self,
+        influencer: Influencer,
+        status: bool,
+        sent_via: Optional[str],
+        error_code: Optional[str],
+        error_reason: Optional[str],
+        sent_at=None,
+    ):
+        """Write a send outcome onto the influencer, its rollup bucket and its batch counters.
+
+        Nothing is committed here: the caller's commit persists the influencer,
+        the rollup and the batch counters together, so they cannot drift apart
+        on failure.
+        """
+        was_processed = influencer.processed_at is not None
+        was_sent = was_processed and bool(influencer.message_status)
+
+        # A retried influencer leaves the bucket of its previous outcome
+        self.campaign_stat_repo.increment_for(influencer, -1)
+
+        processed_at = datetime.datetime.now()
+        influencer.message_status = status
+        influencer.sent_via = sent_via
+        influencer.error_code = error_code
+        influencer.error_reason = error_reason
+        influencer.message_sent_at = sent_at
+        influencer.processed_at = processed_at
+        self.db.add(influencer)
+
+        if influencer.client_id is not None:
+            self.campaign_stat_repo.increment(
+                influencer.client_id, processed_at.date(), sent_via, status, error_code
+            )
+
+        if influencer.batch_id is not None:
+            self.batch_repo.apply_counts(
+                influencer.batch_id,
+                processed=0 if was_processed else 1,
+                sent=int(bool(status)) - int(was_sent),
+                failed=int(not status) - int(was_processed and not was_sent),
+            )
+
+    def get_stats(
+        self,
+        client_id: Optional[int] = None,
+        date_from: Optional[datetime.date] = None,
+        date_to: Optional[datetime.date] = None,
+    ):
+        return self.campaign_stat_repo.get_stats(client_id, date_from, date_to)
+
+    def rebuild(self, client_id: Optional[int] = None):
+        return self.campaign_stat_repo.rebuild(client_id)
@@ -0,0 +1,74 @@
+import csv
+import io
+import tempfile
+from typing import Optional
+from config.database import SessionLocal
+from app.Repositories.InfluencerRepository import InfluencerRepository
+
+EXPORT_COLUMNS = [
+    "id", "username", "client_name", "message_status", "sent_via", "error_code",
+    "error_reason", "message_sent_at", "processed_at", "created_at", "updated_at",
+]
+
+# Excel's per-sheet row limit, header included
+XLSX_MAX_ROWS = 1_048_576
+
+class ExportService:
+    """Streams influencer outcomes as CSV or XLSX in constant memory.
+
+    Each export opens its own session because the generators keep reading
+    from the database after the request handler (and its session) returns.
+    """
+
+    def __init__(self, client_id: Optional[int] = None, batch_id: Optional[int] = None, chunk_size: int = 1000):
+        self.client_id = client_id
+        self.batch_id = batch_id
+        self.chunk_size = chunk_size
+
+    def _rows(self):
+        db = SessionLocal()
+        try:
+            yield from InfluencerRepository(db).iter_export_rows(self.client_id, self.batch_id, self.chunk_size)
+        finally:
+            db.close()
+
+    def iter_csv(self):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        for index, row in enumerate(self._rows(), 1):
+            writer.writerow(row)
+            # Flush the buffer every chunk so each yield carries many rows
+            if index % self.chunk_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+        yield buffer.getvalue()
+
+    def iter_xlsx(self, read_size: int = 64 * 1024):
+        # XLSX is a zip archive that can only be finalised once all rows are
+        # in, so rows go to a write-only workbook (which spools to disk) and
+        # the saved file is then streamed back in chunks.
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = None
+        sheet_rows = XLSX_MAX_ROWS
+        for row in self._rows():
+            # Start a new sheet (with its own header) when the current one is full
+            if sheet_rows == XLSX_MAX_ROWS:
+                sheet_number = len(workbook.worksheets) + 1
+                sheet = workbook.create_sheet("Influencers" if sheet_number == 1 else f"Influencers {sheet_number}")
+                sheet.append(EXPORT_COLUMNS)
+                sheet_rows = 1
+            sheet.append(list(row))
+            sheet_rows += 1
+
+        if sheet is None:
+            workbook.create_sheet("Influencers").append(EXPORT_COLUMNS)
+
+        with tempfile.TemporaryFile() as output:
+            workbook.save(output)
+            output.seek(0)
+            while chunk := output.read(read_size):
+                yield chunk
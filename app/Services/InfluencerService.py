@@ -1,3 +1,4 @@
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.Repositories.InfluencerRepository import InfluencerRepository
 from app.Schemas.influencer import InfluencerCreate
@@ -19,6 +20,21 @@ class InfluencerService:
         # The repository now returns influencers with client_name
         return self.influencer_repo.get_influencers(skip, limit)
 
+    def search_influencers(
+        self,
+        q: str,
+        match: str = "prefix",
+        client_id: Optional[int] = None,
+        message_status: Optional[bool] = None,
+        sent_via: Optional[str] = None,
+        error_code: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ):
+        return self.influencer_repo.search_influencers(
+            q, match, client_id, message_status, sent_via, error_code, cursor, limit
+        )
+
     def update_influencer(self, influencer_id: int, influencer: InfluencerCreate):
         return self.influencer_repo.update_influencer(influencer_id, influencer)
 
@@ -1,4 +1,7 @@
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from app.Utils.Logger import get_logger
+
+logger = get_logger(__name__)
 
 class DMService:
     def __init__(self, page):
@@ -8,26 +11,26 @@ class DMService:
         try:
             message_button = self.page.locator("xpath=//div[@role='button' and contains(., 'Message')]")
             await message_button.click()
-            print("✅ Clicked on the Message button.")
+            logger.debug("Clicked on the Message button")
             await self.page.wait_for_timeout(2000)
 
             try:
                 not_now_button = self.page.locator("xpath=//button[contains(text(),'Not Now')]")
                 await not_now_button.wait_for(state="visible", timeout=5000)
                 await not_now_button.click()
-                print("✅ Closed notification box in DM modal.")
+                logger.debug("Closed notification box in DM modal")
                 await self.page.wait_for_timeout(1000)
             except Exception:
-                print("⚠️ Notification box in DM modal not present or already closed.")
+                logger.debug("Notification box in DM modal not present or already closed")
 
             try:
                 text_input = self.page.locator("xpath=//textarea[@placeholder='Message...']")
                 if not await text_input.is_visible():
                     raise Exception("Textarea not found, trying div with role=textbox.")
-                print("✅ Found textarea input.")
+                logger.debug("Found textarea input")
             except Exception:
                 text_input = self.page.locator("xpath=//div[@role='textbox']")
-                print("✅ Found textarea input.")
+                logger.debug("Found textbox input")
 
             await text_input.click()
             await self.page.wait_for_timeout(500)
@@ -37,13 +40,15 @@ class DMService:
 
             await text_input.press("Enter")
             await self.page.wait_for_timeout(5000)
-            print("✅ Message sent via DM.")
+            logger.info("Message sent via DM")
             return True
             # return "✅ DM Sent"
         
         except PlaywrightTimeoutError:
+            logger.warning("Timeout while interacting with the DM modal")
             return False
             # return "⚠️ Timeout while interacting with the DM modal."
         except Exception as e:
+            logger.warning("DM not sent: %s", e)
             return False
             # return f"⚠️ DM Not Sent: {str(e)}"
\ No newline at end of file
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+
+class BrowserDriver(ABC):
+    """The browser actions a campaign needs, independent of how they are performed.
+
+    Story and reply calls return (status, error_code, error_reason) tuples,
+    matching StoryMessagingService.
+    """
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    @abstractmethod
+    async def navigate(self, username: str):
+        """Open the profile page of username."""
+
+    @abstractmethod
+    async def probe_profile(self, username: str) -> dict:
+        """Return {"available", "is_public", "can_dm", "has_story"} for the open profile."""
+
+    @abstractmethod
+    async def open_story(self):
+        """Open the profile's active story."""
+
+    @abstractmethod
+    async def reply_to_story(self, message: str):
+        """Reply to the story opened by open_story()."""
+
+    @abstractmethod
+    async def send_dm(self, message: str) -> bool:
+        """Send message as a direct message from the open profile."""
@@ -0,0 +1,51 @@
+import asyncio
+import sys
+from config.settings import INSTAGRAM_URL
+from app.Services.Instagram.Drivers.BrowserDriver import BrowserDriver
+from app.Services.Instagram.LoginService import LoginService
+from app.Services.Instagram.ProfileAnalysisService import ProfileAnalysisService
+from app.Services.Instagram.StoryMessagingService import StoryMessagingService
+from app.Services.Instagram.DMService import DMService
+
+class PlaywrightDriver(BrowserDriver):
+    """Drives a real, logged-in Chromium session through Playwright."""
+
+    def __init__(self):
+        self.login_service = LoginService()
+        self.page = None
+
+    async def __aenter__(self):
+        await self.login_service.__aenter__()
+        try:
+            self.page = await self.login_service.login()
+        except BaseException:
+            # __aexit__ won't run if entering fails; close the browser here
+            await self.login_service.__aexit__(*sys.exc_info())
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.login_service.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def navigate(self, username: str):
+        # Goes through the login service so long runs recycle the page/context
+        self.page = await self.login_service.goto(f"{INSTAGRAM_URL}/{username}/")
+        await asyncio.sleep(5)
+
+    async def probe_profile(self, username: str) -> dict:
+        # Check if the page contains "Profile isn't available"
+        profile_unavailable = await self.page.evaluate("document.body.innerText.includes('Profile isn\\'t available')")
+        if profile_unavailable:
+            return {"available": False, "is_public": False, "can_dm": False, "has_story": False}
+
+        profile = await ProfileAnalysisService(self.page).check_profile(username)
+        return {"available": True, **profile}
+
+    async def open_story(self):
+        return await StoryMessagingService(self.page).open_story()
+
+    async def reply_to_story(self, message: str):
+        return await StoryMessagingService(self.page).reply(message)
+
+    async def send_dm(self, message: str) -> bool:
+        return await DMService(self.page).send_message(message)
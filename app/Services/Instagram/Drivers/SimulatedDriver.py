@@ -0,0 +1,111 @@
+import random
+from collections import Counter
+from typing import Optional
+from app.Services.Instagram.Drivers.BrowserDriver import BrowserDriver
+
+# Seconds per action, drawn uniformly from (min, max); navigate includes the page settle time
+DEFAULT_LATENCIES = {
+    "navigate": (7.0, 11.0),
+    "probe_profile": (0.5, 1.5),
+    "open_story": (3.0, 4.0),
+    "reply_to_story": (7.0, 9.0),
+    "send_dm": (9.0, 12.0),
+}
+
+DEFAULT_OUTCOMES = {
+    "profile_unavailable": 0.05,
+    "is_private": 0.2,
+    "can_dm": 0.5,
+    "has_story": 0.35,
+    # Failures when opening / replying to a story, by error code
+    "open_story_errors": {"TIMEOUT_ERROR": 0.02},
+    "reply_errors": {"REPLY_BOX_NOT_FOUND": 0.1, "403": 0.05, "TIMEOUT_ERROR": 0.02},
+    "dm_failure": 0.05,
+}
+
+ERROR_REASONS = {
+    "TIMEOUT_ERROR": "Story Restriction",
+    "REPLY_BOX_NOT_FOUND": "Replies Restricted",
+    "403": "Story Restriction",
+}
+
+
+class VirtualClock:
+    """An asyncio.sleep stand-in that advances a counter instead of waiting."""
+
+    def __init__(self):
+        self.elapsed = 0.0
+
+    async def sleep(self, seconds: float):
+        self.elapsed += seconds
+
+
+class SimulatedDriver(BrowserDriver):
+    """In-memory driver with configurable latencies and outcome distributions.
+
+    Lets the campaign loop, its delays and its DB writes run over large
+    numbers of profiles without a browser. Latencies go through sleep, which
+    defaults to a VirtualClock so simulated hours cost no wall time.
+    """
+
+    def __init__(
+        self,
+        latencies: Optional[dict] = None,
+        outcomes: Optional[dict] = None,
+        seed: Optional[int] = None,
+        sleep=None,
+    ):
+        self.latencies = {**DEFAULT_LATENCIES, **(latencies or {})}
+        self.outcomes = {**DEFAULT_OUTCOMES, **(outcomes or {})}
+        self.random = random.Random(seed)
+        self.clock = VirtualClock()
+        self.sleep = sleep or self.clock.sleep
+        self.calls = Counter()
+        self._profile = None
+
+    async def _act(self, action: str):
+        self.calls[action] += 1
+        low, high = self.latencies[action]
+        if high > 0:
+            await self.sleep(self.random.uniform(low, high))
+
+    def _pick_error(self, errors: dict):
+        roll = self.random.random()
+        for error_code, probability in errors.items():
+            if roll < probability:
+                return error_code
+            roll -= probability
+        return None
+
+    async def navigate(self, username: str):
+        await self._act("navigate")
+        outcomes = self.outcomes
+        available = self.random.random() >= outcomes["profile_unavailable"]
+        self._profile = {
+            "available": available,
+            "is_public": available and self.random.random() >= outcomes["is_private"],
+            "can_dm": available and self.random.random() < outcomes["can_dm"],
+            "has_story": available and self.random.random() < outcomes["has_story"],
+        }
+
+    async def probe_profile(self, username: str) -> dict:
+        await self._act("probe_profile")
+        return dict(self._profile)
+
+    async def open_story(self):
+        await self._act("open_story")
+        error_code = self._pick_error(self.outcomes["open_story_errors"])
+        if error_code:
+            return False, error_code, ERROR_REASONS.get(error_code, "Restriction")
+        return True, None, None
+
+    async def reply_to_story(self, message: str):
+        await self._act("reply_to_story")
+        error_code = self._pick_error(self.outcomes["reply_errors"])
+        if error_code:
+            return False, error_code, ERROR_REASONS.get(error_code, "Restriction")
+        return True, None, None
+
+    async def send_dm(self, message: str) -> bool:
+        await self._act("send_dm")
+        return self.random.random() >= self.outcomes["dm_failure"]
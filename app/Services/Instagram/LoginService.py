@@ -1,9 +1,49 @@
+import asyncio
 import os
 import json
 import random
 from pathlib import Path
 from playwright.async_api import async_playwright
-from config.settings import INSTAGRAM_URL, INSTAGRAM_USERNAME, INSTAGRAM_PASSWORD, SESSION_STORAGE_PATH
+from config.settings import (
+    INSTAGRAM_URL, INSTAGRAM_USERNAME, INSTAGRAM_PASSWORD, SESSION_STORAGE_PATH,
+    BROWSER_PAGE_MAX_NAVIGATIONS, BROWSER_CONTEXT_MAX_PAGES, BROWSER_MAX_RSS_MB,
+    BROWSER_RSS_RECYCLE_MIN_NAVIGATIONS,
+)
+from app.Utils.Logger import get_logger
+
+try:
+    import psutil
+except ImportError:  # RSS-based recycling is skipped without psutil
+    psutil = None
+
+logger = get_logger(__name__)
+
+# Serialises browser launches so each LoginService can tell which newly
+# spawned child process is its own Playwright driver
+_launch_lock = asyncio.Lock()
+
+def _child_pids():
+    if psutil is None:
+        return set()
+    return {child.pid for child in psutil.Process(os.getpid()).children()}
+
+def process_tree_rss_mb(pids):
+    """Resident memory of the given processes and all their descendants, in MB."""
+    if psutil is None or not pids:
+        return None
+    rss = 0
+    for pid in pids:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            continue
+        for process in processes:
+            try:
+                rss += process.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+    return rss / (1024 * 1024)
 
 class LoginService:
     def __init__(self):
@@ -12,12 +52,25 @@ class LoginService:
         self.context = None
         self.page = None
         self.session_file = Path(SESSION_STORAGE_PATH)
+        # Usage counters driving page/context recycling
+        self.page_navigations = 0
+        self.context_pages = 0
+        self.recycled_pages = 0
+        self.recycled_contexts = 0
+        self.relaunched_browsers = 0
+        self.navigations_since_rss_recycle = 0
+        # The Playwright driver process this service started; Chromium runs under it
+        self.process_pids = set()
 
     async def __aenter__(self):
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=True)
+        async with _launch_lock:
+            existing_pids = _child_pids()
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=True)
+            self.process_pids = _child_pids() - existing_pids
         self.context = await self.browser.new_context()
         self.page = await self.context.new_page()
+        self.context_pages = 1
         await self.page.goto(INSTAGRAM_URL)
         return self
 
@@ -82,4 +135,84 @@ class LoginService:
                 }
             }""",
             json.loads(session_data["local_storage"])
-        )
\ No newline at end of file
+        )
+
+    def usage(self):
+        return {
+            "page_navigations": self.page_navigations,
+            "context_pages": self.context_pages,
+            "recycled_pages": self.recycled_pages,
+            "recycled_contexts": self.recycled_contexts,
+            "relaunched_browsers": self.relaunched_browsers,
+            "rss_mb": self.rss_mb(),
+        }
+
+    def rss_mb(self):
+        """Resident memory of this service's driver and browser processes only."""
+        return process_tree_rss_mb(self.process_pids)
+
+    async def goto(self, url, **kwargs):
+        """Navigate the current page, recycling it first if it has outlived its budget.
+
+        Returns the page to use afterwards, which may be a new one.
+        """
+        await self.maybe_recycle()
+        await self.page.goto(url, **kwargs)
+        self.page_navigations += 1
+        self.navigations_since_rss_recycle += 1
+        return self.page
+
+    async def maybe_recycle(self):
+        # RSS is only checked after a cooldown, so a browser whose baseline
+        # sits near the limit is not recycled on every navigation
+        if self.navigations_since_rss_recycle >= BROWSER_RSS_RECYCLE_MIN_NAVIGATIONS:
+            rss_mb = self.rss_mb()
+            if rss_mb is not None and rss_mb >= BROWSER_MAX_RSS_MB:
+                logger.info("Browser RSS %.0f MB over limit, recycling context", rss_mb)
+                await self.recycle_context()
+                self.navigations_since_rss_recycle = 0
+                rss_mb = self.rss_mb()
+                if rss_mb is not None and rss_mb >= BROWSER_MAX_RSS_MB:
+                    # Memory is held by the browser process itself
+                    logger.info("Browser RSS still %.0f MB, relaunching browser", rss_mb)
+                    await self.relaunch_browser()
+                return
+
+        if self.page_navigations >= BROWSER_PAGE_MAX_NAVIGATIONS:
+            if self.context_pages >= BROWSER_CONTEXT_MAX_PAGES:
+                await self.recycle_context()
+            else:
+                await self.recycle_page()
+
+    async def recycle_page(self):
+        # A fresh page in the same context keeps cookies and storage
+        old_page = self.page
+        self.page = await self.context.new_page()
+        await old_page.close()
+        self.context_pages += 1
+        self.page_navigations = 0
+        self.recycled_pages += 1
+        logger.info("Recycled page: %s", self.usage())
+
+    async def recycle_context(self):
+        # Carry the logged-in session over so no new login is needed
+        storage_state = await self.context.storage_state()
+        await self.context.close()
+        self.context = await self.browser.new_context(storage_state=storage_state)
+        self.page = await self.context.new_page()
+        self.context_pages = 1
+        self.page_navigations = 0
+        self.recycled_contexts += 1
+        logger.info("Recycled context: %s", self.usage())
+
+    async def relaunch_browser(self):
+        # Same driver process, new Chromium; the session carries over as in recycle_context
+        storage_state = await self.context.storage_state()
+        await self.browser.close()
+        self.browser = await self.playwright.chromium.launch(headless=True)
+        self.context = await self.browser.new_context(storage_state=storage_state)
+        self.page = await self.context.new_page()
+        self.context_pages = 1
+        self.page_navigations = 0
+        self.relaunched_browsers += 1
+        logger.info("Relaunched browser: %s", self.usage())
@@ -1,5 +1,8 @@
 from config.settings import INSTAGRAM_URL
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from app.Utils.Logger import get_logger
+
+logger = get_logger(__name__)
 
 class ProfileAnalysisService:
     def __init__(self, page):
@@ -8,15 +11,15 @@ class ProfileAnalysisService:
     async def check_profile(self, username):
         try:
             is_private = await self.page.locator("text=This Account is Private").is_visible()
-            print(f"🔹 Profile private: {is_private}")
+            logger.debug("Profile private: %s", is_private)
 
             dm_locator = self.page.locator("xpath=//div[@role='button' and contains(., 'Message')]")
             can_dm = await dm_locator.is_visible()
-            print(f"🔹 Can DM: {can_dm}")
+            logger.debug("Can DM: %s", can_dm)
 
             story_locator = self.page.locator("xpath=//div[@role='button' and .//img[contains(@alt, 'profile picture')]]")
             has_story = await story_locator.is_visible()
-            print(f"🔹 Has Story: {has_story}")
+            logger.debug("Has story: %s", has_story)
 
             return {
                 "is_public": not is_private,
@@ -24,5 +27,5 @@ class ProfileAnalysisService:
                 "has_story": has_story
             }
         except PlaywrightTimeoutError:
-            print("⚠️ Timeout while analyzing profile!")
+            logger.warning("Timeout while analyzing profile %s", username)
             return {"is_public": False, "can_dm": False, "has_story": False}
\ No newline at end of file
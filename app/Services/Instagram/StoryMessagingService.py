@@ -1,19 +1,39 @@
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from app.Utils.Logger import get_logger
+
+logger = get_logger(__name__)
 
 class StoryMessagingService:
     def __init__(self, page: Page):
         self.page = page
 
     async def reply_to_story(self, message: str):
+        status, error_code, error_reason = await self.open_story()
+        if not status:
+            return status, error_code, error_reason
+        return await self.reply(message)
+
+    async def open_story(self):
         try:
             story_locator = self.page.locator("xpath=//div[@role='button' and .//img[contains(@alt, 'profile picture')]]")
             await story_locator.click()
             await self.page.wait_for_timeout(3000)
+            return True, None, None
+
+        except PlaywrightTimeoutError:
+            logger.warning("Timeout while opening the story")
+            return False, "TIMEOUT_ERROR", "Story Restriction"
+        except Exception as e:
+            logger.exception("Opening story failed: %s", e)
+            return False, "UNKNOWN_ERROR", "Restriction"
 
+    async def reply(self, message: str):
+        # Expects the story viewer to be open (see open_story)
+        try:
             message_input = self.page.locator("xpath=//textarea[contains(@placeholder, 'Reply to')]")
             
             if await message_input.count() == 0:
-                print("⚠️ Reply box not found. Replies might be restricted.")
+                logger.warning("Reply box not found, replies might be restricted")
                 return False, "REPLY_BOX_NOT_FOUND", "Replies Restricted"
                 
             await message_input.click()
@@ -29,15 +49,15 @@ class StoryMessagingService:
             response = await response_info.value
 
             if response.status == 200:
-                print("✅ Story reply sent successfully.")
+                logger.info("Story reply sent")
                 return True, None, None  # No error
             else:
-                print(f"⚠️ Failed to send story reply. Status code: {response.status}")
+                logger.warning("Story reply failed with status %s", response.status)
                 return False, str(response.status), "Story Restriction" if response.status == 403 else "Restriction"
 
         except PlaywrightTimeoutError:
-            print("⚠️ Timeout while interacting with the story.")
+            logger.warning("Timeout while interacting with the story")
             return False, "TIMEOUT_ERROR", "Story Restriction"
         except Exception as e:
-            print(f"⚠️ An error occurred: {str(e)}")
+            logger.exception("Story reply failed: %s", e)
             return False, "UNKNOWN_ERROR", "Restriction"
@@ -0,0 +1,85 @@
+from types import MappingProxyType
+from typing import Optional
+import jwt
+from fastapi import Depends, Request
+from fastapi_users import BaseUserManager, IntegerIDMixin, exceptions
+from fastapi_users.authentication import JWTStrategy
+from fastapi_users.jwt import decode_jwt
+from sqlalchemy.orm import make_transient_to_detached
+from app.Models.User import User
+from app.Repositories.UserRepository import get_user_db
+from app.Utils.Cache import LRUCache
+from app.Utils.Logger import get_logger
+from config.settings import JWT_SECRET, AUTH_USER_CACHE_MAX_ENTRIES, AUTH_USER_CACHE_TTL_SECONDS
+
+logger = get_logger(__name__)
+
+# user id (JWT "sub") -> read-only snapshot of the User row, so authenticated
+# requests skip the DB lookup
+principal_cache = LRUCache(AUTH_USER_CACHE_MAX_ENTRIES, AUTH_USER_CACHE_TTL_SECONDS)
+
+class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
+    reset_password_token_secret = JWT_SECRET
+    verification_token_secret = JWT_SECRET
+
+    async def on_after_register(self, user: User, request: Optional[Request] = None):
+        logger.info("User %s registered", user.id)
+
+    async def on_after_update(self, user: User, update_dict: dict, request: Optional[Request] = None):
+        # Changes (is_active, is_superuser, ...) apply at once on this worker;
+        # other workers pick them up when their cache entry expires.
+        principal_cache.delete(str(user.id))
+
+    async def on_before_delete(self, user: User, request: Optional[Request] = None):
+        principal_cache.delete(str(user.id))
+
+async def get_user_manager(user_db=Depends(get_user_db)):
+    yield UserManager(user_db)
+
+def snapshot_user(user: User):
+    return MappingProxyType({column.key: getattr(user, column.key) for column in User.__table__.columns})
+
+def user_from_snapshot(snapshot) -> User:
+    # A fresh detached instance per request: nothing mutable is shared
+    # between requests, and it can still be attached to a session later.
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+class CachedJWTStrategy(JWTStrategy):
+    """JWT strategy that resolves the token's user from principal_cache.
+
+    The token is checked by signature, expiry and audience only; the DB is
+    hit only on a cache miss. Write requests (use_cache=False) always load
+    the user from the DB, since they may modify it.
+    """
+
+    def __init__(self, *args, use_cache: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_cache = use_cache
+
+    async def read_token(self, token: Optional[str], user_manager: BaseUserManager):
+        if token is None:
+            return None
+
+        try:
+            data = decode_jwt(token, self.decode_key, self.token_audience, algorithms=[self.algorithm])
+        except jwt.PyJWTError:
+            return None
+
+        user_id = data.get("sub")
+        if user_id is None:
+            return None
+
+        if self.use_cache:
+            snapshot = principal_cache.get(user_id)
+            if snapshot is not None:
+                return user_from_snapshot(snapshot)
+
+        try:
+            user = await user_manager.get(user_manager.parse_id(user_id))
+        except (exceptions.UserNotExists, exceptions.InvalidID):
+            return None
+        if self.use_cache:
+            principal_cache.set(user_id, snapshot_user(user))
+        return user
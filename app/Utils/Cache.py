@@ -0,0 +1,142 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from fastapi import Request, Response
+from config.settings import RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_SECONDS
+
+
+class LRUCache:
+    """Thread-safe LRU cache with a per-entry TTL and a bounded number of entries."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix):
+        # Keys are tuples; drop every key whose first element is prefix
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == prefix]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class CachedResponse:
+    __slots__ = ("body", "etag", "last_modified")
+
+    def __init__(self, body: bytes, etag: str, last_modified: float):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class ResponseCache:
+    """Serialized responses for read endpoints, grouped into namespaces.
+
+    Keys are (namespace, route, params). Writes invalidate a whole namespace,
+    which also bumps its Last-Modified time. The cache is per process, so with
+    several workers the TTL bounds how stale a peer worker can be.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES, ttl: float = RESPONSE_CACHE_TTL_SECONDS):
+        self._cache = LRUCache(max_entries, ttl)
+        self._modified_at = {}
+        self._started_at = time.time()
+
+    def last_modified(self, namespace: str) -> float:
+        return self._modified_at.get(namespace, self._started_at)
+
+    def get(self, namespace: str, *key):
+        return self._cache.get((namespace,) + key)
+
+    def set(self, namespace: str, *key, body: bytes, last_modified: float) -> CachedResponse:
+        entry = CachedResponse(body, '"' + hashlib.sha1(body).hexdigest() + '"', last_modified)
+        # Skip storing if a write invalidated the namespace while body was built
+        if self.last_modified(namespace) == last_modified:
+            self._cache.set((namespace,) + key, entry)
+        return entry
+
+    def invalidate(self, *namespaces: str):
+        now = time.time()
+        for namespace in namespaces:
+            self._modified_at[namespace] = now
+            self._cache.delete_prefix(namespace)
+
+    def clear(self):
+        self._modified_at.clear()
+        self._cache.clear()
+
+
+response_cache = ResponseCache()
+
+
+def _not_modified(request: Request, entry: CachedResponse) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or entry.etag in tags or f"W/{entry.etag}" in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates only carry whole seconds
+        return int(entry.last_modified) <= since
+    return False
+
+
+def cached_response(request: Request, namespace: str, key: tuple, build) -> Response:
+    """Serve a JSON body from the response cache, calling build() on a miss.
+
+    build() returns the serialized body as bytes, or None when the resource
+    does not exist (misses are not cached). Answers conditional requests
+    with 304 Not Modified.
+    """
+    entry = response_cache.get(namespace, *key)
+    if entry is None:
+        last_modified = response_cache.last_modified(namespace)
+        body = build()
+        if body is None:
+            return None
+        entry = response_cache.set(namespace, *key, body=body, last_modified=last_modified)
+
+    headers = {
+        "ETag": entry.etag,
+        "Last-Modified": formatdate(entry.last_modified, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+    if _not_modified(request, entry):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
@@ -0,0 +1,145 @@
+import contextvars
+import copy
+import datetime
+import json
+import logging
+import queue
+import random
+import sys
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from config.settings import LOG_LEVEL, LOG_LEVELS, LOG_DEBUG_SAMPLE_RATE
+
+# Ids attached to every record logged inside log_context(...)
+CONTEXT_FIELDS = ("job_id", "account_id", "influencer_id")
+_log_context = contextvars.ContextVar("log_context", default={})
+
+_listener = None
+
+
+class ContextFilter(logging.Filter):
+    """Copies the current log context onto the record.
+
+    Runs on the calling task, before the record is queued, because context
+    variables are not visible from the listener thread.
+    """
+
+    def filter(self, record):
+        context = _log_context.get()
+        for field in CONTEXT_FIELDS:
+            if not hasattr(record, field):
+                setattr(record, field, context.get(field))
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps only a fraction of DEBUG records; other levels always pass."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        payload = {
+            "ts": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                payload[field] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueues the raw record; formatting happens on the listener thread."""
+
+    def prepare(self, record):
+        # Resolve args and tracebacks now (they may change or hold references
+        # to live objects), but leave JSON encoding to the listener.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _parse_levels(spec: str):
+    levels = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        name, level = item.split("=", 1)
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(
+    level: str = LOG_LEVEL,
+    levels: str = LOG_LEVELS,
+    debug_sample_rate: float = LOG_DEBUG_SAMPLE_RATE,
+    stream=None,
+):
+    """Route all logging through a queue to a JSON stream handler.
+
+    Callers only pay for a put_nowait on an in-memory queue; a background
+    thread formats and writes the records, so a slow or piped stdout never
+    blocks the event loop. Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter())
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(debug_sample_rate))
+    queue_handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(level.upper())
+    for name, module_level in _parse_levels(levels).items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(name)
+
+
+@contextmanager
+def log_context(**fields):
+    """Attach job/account/influencer ids to every record logged in this block."""
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
@@ -0,0 +1,50 @@
+from pathlib import Path
+from config.database import engine
+from config.settings import MIGRATION_CHECK, JWT_SECRET
+from app.Utils.Logger import get_logger, setup_logging, shutdown_logging
+
+logger = get_logger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+def check_migrations(mode: str = MIGRATION_CHECK):
+    """Compare the database revision with the Alembic head.
+
+    The schema is only ever changed by `alembic upgrade head`; this just
+    reports drift ("warn") or refuses to start ("strict").
+    """
+    if mode == "off":
+        return
+
+    from alembic.config import Config
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    config = Config(str(BASE_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BASE_DIR / "alembic"))
+    heads = set(ScriptDirectory.from_config(config).get_heads())
+
+    with engine.connect() as connection:
+        current = set(MigrationContext.configure(connection).get_current_heads())
+
+    if current != heads:
+        message = (
+            f"Database schema is at {sorted(current) or 'no revision'}, "
+            f"migrations head is {sorted(heads)}; run `alembic upgrade head`"
+        )
+        if mode == "strict":
+            raise RuntimeError(message)
+        logger.warning(message)
+
+def check_settings():
+    # Without a secret every login fails when the token is encoded
+    if not JWT_SECRET:
+        raise RuntimeError("JWT_SECRET is not set; refusing to start without a token signing secret")
+
+def startup():
+    check_settings()
+    setup_logging()
+    check_migrations()
+
+def shutdown():
+    shutdown_logging()
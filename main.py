@@ -1,18 +1,22 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from contextlib import asynccontextmanager
-from routes.api.v0.instagram import router as instagram_router
 from routes.api.v0.clients import router as clients_router
-from config.database import engine
-from app.Models.Client import Base
 from routes.api.v0.influencers import router as influencers_router
+from routes.api.v0.stats import router as stats_router
+from routes.api.v0.batches import router as batches_router
+from routes.api.v0.auth import router as auth_router
+from app.Http.Controllers.AuthController import current_active_user
 from fastapi.middleware.cors import CORSMiddleware
+from bootstrap.app_startup import startup, shutdown
+from config.settings import ENABLE_AUTOMATION
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Actions to perform during startup
-    Base.metadata.create_all(bind=engine)
+    # Actions to perform during startup; the schema is managed by Alembic
+    startup()
     yield
     # Actions to perform during shutdown (if any)
+    shutdown()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -34,7 +38,16 @@ app.add_middleware(
 )
 
 
-app.include_router(instagram_router)
-# app.include_router(instagram_router, prefix="/api/v0", tags=["Instagram Bot"])
-app.include_router(clients_router, prefix="/api/v0", tags=["clients"])
-app.include_router(influencers_router, prefix="/api/v0", tags=["influencers"])
+# Everything except the auth endpoints requires a valid JWT
+authenticated = [Depends(current_active_user)]
+
+app.include_router(auth_router, prefix="/api/v0")
+if ENABLE_AUTOMATION:
+    # Playwright itself is only imported on the first send-messages call
+    from routes.api.v0.instagram import router as instagram_router
+    app.include_router(instagram_router, dependencies=authenticated)
+    # app.include_router(instagram_router, prefix="/api/v0", tags=["Instagram Bot"])
+app.include_router(clients_router, prefix="/api/v0", tags=["clients"], dependencies=authenticated)
+app.include_router(influencers_router, prefix="/api/v0", tags=["influencers"], dependencies=authenticated)
+app.include_router(stats_router, prefix="/api/v0", tags=["stats"], dependencies=authenticated)
+app.include_router(batches_router, prefix="/api/v0", tags=["batches"], dependencies=authenticated)
@@ -1,12 +1,20 @@
-from fastapi import APIRouter
-from fastapi_users import FastAPIUsers
-from app.Http.Controllers.AuthController import auth_backend, fastapi_users, User
+from fastapi import APIRouter, Depends
+from app.Http.Controllers.AuthController import auth_backend, fastapi_users, current_superuser
+from app.Schemas.user import UserRead, UserCreate, UserUpdate
 
 router = APIRouter()
 
 router.include_router(
     fastapi_users.get_auth_router(auth_backend), prefix="/auth/jwt", tags=["auth"]
 )
+# No self-registration: only superusers can create accounts. The first
+# superuser comes from `python -m app.Console.Commands.CreateUser --superuser`.
 router.include_router(
-    fastapi_users.get_register_router(User), prefix="/auth", tags=["auth"]
+    fastapi_users.get_register_router(UserRead, UserCreate),
+    prefix="/auth",
+    tags=["auth"],
+    dependencies=[Depends(current_superuser)],
+)
+router.include_router(
+    fastapi_users.get_users_router(UserRead, UserUpdate), prefix="/users", tags=["users"]
 )
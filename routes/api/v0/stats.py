@@ -0,0 +1,5 @@
+from fastapi import APIRouter
+from app.Http.Controllers import StatsController
+
+router = APIRouter()
+router.include_router(StatsController.router, prefix="/stats", tags=["Stats"])